@@ -1,5 +1,6 @@
 import os
 import platform
+import sys
 from utils.environment import (
     check_env_exists,
     setup_environment,
@@ -14,14 +15,38 @@ aocd_dir = os.path.join(".aocd_cache")
 os.environ["AOCD_DIR"] = aocd_dir
 
 
+_MENU = r""" .----------------. .----------------. .----------------. .----------------. .----------------. .----------------. .----------------.
+| .--------------. | .--------------. | .--------------. | .--------------. | .--------------. | .--------------. | .--------------. |
+| |      __      | | |     ____     | | |     ______   | | |              | | |  _________   | | |   _____      | | |  _________   | |
+| |     /  \     | | |   .'    `.   | | |   .' ___  |  | | |              | | | |_   ___  |  | | |  |_   _|     | | | |_   ___  |  | |
+| |    / /\ \    | | |  /  .--.  \  | | |  / .'   \_|  | | |              | | |   | |_  \_|  | | |    | |       | | |   | |_  \_|  | |
+| |   / ____ \   | | |  | |    | |  | | |  | |         | | |              | | |   |  _|  _   | | |    | |   _   | | |   |  _|      | |
+| | _/ /    \ \_ | | |  \  `--'  /  | | |  \ `.___.'\  | | |              | | |  _| |___/ |  | | |   _| |__/ |  | | |  _| |_       | |
+| ||____|  |____|| | |   `.____.'   | | |   `._____.'  | | |   _______    | | | |_________|  | | |  |________|  | | | |_____|      | |
+| |              | | |              | | |              | | |  |_______|   | | |              | | |              | | |              | |
+| '--------------' | '--------------' | '--------------' | '--------------' | '--------------' | '--------------' | '--------------' |
+'----------------' '----------------' '----------------' '----------------' '----------------' '----------------' '----------------'
+To provide any contributions to the project visit -> https://github.com/http-kennedy/aoc_elf
+
+NOTE: For any option that requires a 'year' and 'day' during December 01-25 (system date) the defaults will be set to current 'year' and 'day'.
+
+
+Choose an option:
+0. Setup|Modify aoc_elf configurations.
+1. Create AoC solutions environment.
+2. Fetch AoC input and example data.
+3. Submit AoC answer.
+4. Perform Git operations **EXPERIMENTAL && UNTESTED -> DO NOT USE**
+5. Exit
+"""
+
+
 def clear_screen() -> None:
     """
-    Clears the terminal screen based on the operating system.
+    Clears the terminal screen using ANSI escape codes.
     """
-    if platform.system().lower() == "windows":
-        os.system("cls")
-    else:
-        os.system("clear")
+    sys.stdout.write("\x1b[H\x1b[2J")
+    sys.stdout.flush()
 
 
 def display_menu() -> None:
@@ -29,65 +54,16 @@ def display_menu() -> None:
     Displays the main menu options to the user.
     """
     clear_screen()
-
-    print(
-        " .----------------. .----------------. .----------------. .----------------. .----------------. .----------------. .----------------."
-    )
-    print(
-        "| .--------------. | .--------------. | .--------------. | .--------------. | .--------------. | .--------------. | .--------------. |"
-    )
-    print(
-        "| |      __      | | |     ____     | | |     ______   | | |              | | |  _________   | | |   _____      | | |  _________   | |"
-    )
-    print(
-        "| |     /  \     | | |   .'    `.   | | |   .' ___  |  | | |              | | | |_   ___  |  | | |  |_   _|     | | | |_   ___  |  | |"
-    )
-    print(
-        "| |    / /\ \    | | |  /  .--.  \  | | |  / .'   \_|  | | |              | | |   | |_  \_|  | | |    | |       | | |   | |_  \_|  | |"
-    )
-    print(
-        "| |   / ____ \   | | |  | |    | |  | | |  | |         | | |              | | |   |  _|  _   | | |    | |   _   | | |   |  _|      | |"
-    )
-    print(
-        "| | _/ /    \ \_ | | |  \  `--'  /  | | |  \ `.___.'\  | | |              | | |  _| |___/ |  | | |   _| |__/ |  | | |  _| |_       | |"
-    )
-    print(
-        "| ||____|  |____|| | |   `.____.'   | | |   `._____.'  | | |   _______    | | | |_________|  | | |  |________|  | | | |_____|      | |"
-    )
-    print(
-        "| |              | | |              | | |              | | |  |_______|   | | |              | | |              | | |              | |"
-    )
-    print(
-        "| '--------------' | '--------------' | '--------------' | '--------------' | '--------------' | '--------------' | '--------------' |"
-    )
-    print(
-        "'----------------' '----------------' '----------------' '----------------' '----------------' '----------------' '----------------'"
-    )
-
-    print(
-        "To provide any contributions to the project visit -> https://github.com/http-kennedy/aoc_elf"
-    )
-    print(
-        "\nNOTE: For any option that requires a 'year' and 'day' during December 01-25 (system date) the defaults will be set to current 'year' and 'day'.\n"
-    )
-    print("\nChoose an option:")
-    print("0. Setup|Modify aoc_elf configurations.")
-    print("1. Create AoC solutions environment.")
-    print("2. Fetch AoC input and example data.")
-    print("3. Submit AoC answer.")
-    print("4. Perform Git operations **EXPERIMENTAL && UNTESTED -> DO NOT USE**")
-    print("5. Exit")
+    sys.stdout.write(_MENU)
 
 
 def main() -> None:
     """
     Main function of the application. Handles the user interface and menu selection.
+    Feature modules are imported on first use so exiting doesn't pay for aocd/bs4 imports.
     """
-    from utils.config import setup_config
-    from utils.file_operations import setup_aoc_environment
-    from utils.aoc_data import fetch_data_for_day
-    from utils.answer_submission import submit_answer
-    from utils.git_operations import perform_git_operations
+    if platform.system().lower() == "windows":
+        os.system("")  # Enables ANSI escape code processing in the Windows console
 
     global BASE_DIR, GITHUB_REPO, AOC_SESSION
     BASE_DIR, _, GITHUB_REPO, AOC_SESSION = initialize_environment()
@@ -99,6 +75,8 @@ def main() -> None:
             choice = input("\nEnter your choice: ").strip()
 
             if choice == "0":
+                from utils.config import setup_config
+
                 setup_config()
                 (
                     BASE_DIR,
@@ -113,6 +91,8 @@ def main() -> None:
                         "\nYour base directory has not been set. Please run option 0 before using this feature."
                     )
                 else:
+                    from utils.file_operations import setup_aoc_environment
+
                     setup_aoc_environment()
             elif choice == "2":
                 if "AOC_SESSION" in unused_envs:
@@ -120,6 +100,8 @@ def main() -> None:
                         "\nYour base directory and/or AOC session token has not been set. Please run option 0 before using this feature."
                     )
                 else:
+                    from utils.aoc_data import fetch_data_for_day
+
                     fetch_data_for_day()
             elif choice == "3":
                 if "AOC_SESSION" in unused_envs:
@@ -127,6 +109,8 @@ def main() -> None:
                         "\nYour AOC session token has not been set. Please run option 0 before using this feature."
                     )
                 else:
+                    from utils.answer_submission import submit_answer
+
                     submit_answer()
             elif choice == "4":
                 if "GITHUB_REPO" in unused_envs:
@@ -134,6 +118,8 @@ def main() -> None:
                         "\nYour GitHub repository has not been set. Please run option 0 before using this feature."
                     )
                 else:
+                    from utils.git_operations import perform_git_operations
+
                     perform_git_operations()
             elif choice == "5":
                 print("Exiting...")
@@ -2,9 +2,8 @@ import os
 import json
 import re
 import time
-import glob
 from datetime import datetime, timedelta
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, FeatureNotFound
 from dateutil.parser import parse
 from dateutil.tz import tzlocal
 from aocd.models import Puzzle, User
@@ -18,6 +17,14 @@ from utils.aoc_data import (
 )
 from aoc_elf import aocd_dir
 
+_WAIT_MS_RE = re.compile(r"You have (\d+)m (\d+)s left to wait\.", re.IGNORECASE)
+_WAIT_MIN_RE = re.compile(
+    r"please wait (\d+) minutes before trying again", re.IGNORECASE
+)
+
+# Last result of read_last_submission_feedback, keyed on the newest post file mtime
+_FEEDBACK_CACHE = {}
+
 
 def setup_user_session() -> str:
     """
@@ -58,9 +65,7 @@ def parse_wait_time(message: str) -> timedelta:
     Returns:
         A timedelta object representing the wait time.
     """
-    wait_time_match = re.search(
-        r"You have (\d+)m (\d+)s left to wait.", message, re.IGNORECASE
-    )
+    wait_time_match = _WAIT_MS_RE.search(message)
     if wait_time_match:
         minutes, seconds = map(int, wait_time_match.groups())
         return timedelta(minutes=minutes, seconds=seconds)
@@ -68,9 +73,7 @@ def parse_wait_time(message: str) -> timedelta:
     if "one minute" in message:
         return timedelta(minutes=1)
 
-    minutes_wait_match = re.search(
-        r"please wait (\d+) minutes before trying again", message, re.IGNORECASE
-    )
+    minutes_wait_match = _WAIT_MIN_RE.search(message)
     if minutes_wait_match:
         minutes = int(minutes_wait_match.group(1))
         return timedelta(minutes=minutes)
@@ -78,6 +81,25 @@ def parse_wait_time(message: str) -> timedelta:
     return timedelta()
 
 
+def _iter_post_files() -> list[str]:
+    """
+    Collects the submission feedback files stored one level below the aocd cache directory.
+
+    Returns:
+        A list of paths to the '*_post.json' files.
+    """
+    post_files = []
+    with os.scandir(aocd_dir) as cache_entries:
+        for sub_dir in cache_entries:
+            if not sub_dir.is_dir():
+                continue
+            with os.scandir(sub_dir.path) as entries:
+                for entry in entries:
+                    if entry.name.endswith("_post.json") and entry.is_file():
+                        post_files.append(entry.path)
+    return post_files
+
+
 def read_last_submission_feedback() -> dict:
     """
     Reads the last submission feedback from stored JSON files.
@@ -85,32 +107,56 @@ def read_last_submission_feedback() -> dict:
     Returns:
         A dictionary containing the feedback of the last submission.
     """
-    if not os.path.exists(aocd_dir):
+    if not os.path.isdir(aocd_dir):
         return None
 
-    post_files = glob.glob(os.path.join(aocd_dir, "**/*_post.json"), recursive=True)
+    # Newest files first so the first file ending in a rate-limit message is the latest one
+    post_files = sorted(
+        ((os.stat(path).st_mtime_ns, path) for path in _iter_post_files()),
+        reverse=True,
+    )
+
+    signature = post_files[0][0] if post_files else 0
+    if _FEEDBACK_CACHE.get("signature") == signature:
+        return _FEEDBACK_CACHE["feedback"]
 
     latest_valid_feedback = None
-    latest_submission_time = None
-
-    for feedback_file in post_files:
-        with open(feedback_file, "r") as file:
-            data = json.load(file)
-            if data:
-                latest_feedback = data[-1]
-                submission_time = parse(latest_feedback["when"])
-
-                if "wait" in latest_feedback.get("message", ""):
-                    if (
-                        latest_submission_time is None
-                        or submission_time > latest_submission_time
-                    ):
-                        latest_valid_feedback = latest_feedback
-                        latest_submission_time = submission_time
 
+    for _, feedback_file in post_files:
+        with open(feedback_file, "rb") as file:
+            raw = file.read()
+
+        if b"wait" not in raw:
+            continue
+
+        data = json.loads(raw)
+        if data:
+            latest_feedback = data[-1]
+            if "wait" in latest_feedback.get("message", ""):
+                latest_valid_feedback = latest_feedback
+                break
+
+    _FEEDBACK_CACHE.update(signature=signature, feedback=latest_valid_feedback)
     return latest_valid_feedback
 
 
+def parse_submission_time(when: str) -> datetime:
+    """
+    Parses the 'when' timestamp aocd stores alongside each submission.
+
+    Args:
+        when: The timestamp string, normally in ISO 8601 format.
+
+    Returns:
+        A datetime object representing the submission time.
+    """
+    try:
+        return datetime.fromisoformat(when)
+    except ValueError:
+        # Older cache entries may not be strict ISO 8601
+        return parse(when)
+
+
 def display_countdown_timer(remaining_time: timedelta) -> None:
     """
     Displays a countdown timer for the given remaining time.
@@ -118,12 +164,24 @@ def display_countdown_timer(remaining_time: timedelta) -> None:
     Args:
         remaining_time: The remaining time as a timedelta object.
     """
-    while remaining_time.total_seconds() > 0:
-        mins, secs = divmod(int(remaining_time.total_seconds()), 60)
-        timer = f"{mins:02d}:{secs:02d}"
-        print(f"Rate limit in effect. Please wait: {timer}", end="\r")
-        time.sleep(1)
-        remaining_time -= timedelta(seconds=1)
+    remaining_ns = remaining_time // timedelta(microseconds=1) * 1000
+    deadline_ns = time.monotonic_ns() + remaining_ns
+    last_printed = -1
+
+    while True:
+        remaining_ns = deadline_ns - time.monotonic_ns()
+        if remaining_ns <= 0:
+            break
+
+        secs_left, partial_ns = divmod(remaining_ns, 1_000_000_000)
+        if secs_left != last_printed:
+            mins, secs = divmod(secs_left, 60)
+            timer = f"{mins:02d}:{secs:02d}"
+            print(f"Rate limit in effect. Please wait: {timer}", end="\r")
+            last_printed = secs_left
+
+        # Wake on the next whole-second boundary rather than a fixed 1s tick
+        time.sleep((partial_ns or 1_000_000_000) / 1e9)
     print("\nYou may now submit your answer.")
 
 
@@ -134,16 +192,20 @@ def calculate_remaining_wait_time() -> timedelta:
     Returns:
         A timedelta object representing the remaining wait time.
     """
+    # No cache directory means nothing has been submitted yet
+    if not os.path.isdir(aocd_dir):
+        return timedelta()
+
     feedback = read_last_submission_feedback()
-    if feedback and "wait" in feedback.get("message", ""):
-        wait_time = parse_wait_time(feedback["message"])
-        submission_time = parse(feedback["when"])
-        current_time = datetime.now(tz=tzlocal())
-        elapsed_time = current_time - submission_time
-        remaining_time = wait_time - elapsed_time
-        return max(remaining_time, timedelta(0))
+    if not feedback or "wait" not in feedback.get("message", ""):
+        return timedelta()
 
-    return timedelta()
+    wait_time = parse_wait_time(feedback["message"])
+    submission_time = parse_submission_time(feedback["when"])
+    current_time = datetime.now(tz=tzlocal())
+    elapsed_time = current_time - submission_time
+    remaining_time = wait_time - elapsed_time
+    return max(remaining_time, timedelta(0))
 
 
 def submit_answer_attempt(
@@ -178,7 +240,10 @@ def submit_answer_attempt(
             )
 
             submission_result_data = submission_result.data.decode("utf-8")
-            soup = BeautifulSoup(submission_result_data, "html.parser")
+            try:
+                soup = BeautifulSoup(submission_result_data, "lxml")
+            except FeatureNotFound:
+                soup = BeautifulSoup(submission_result_data, "html.parser")
             article = soup.find("article")
 
             if article:
@@ -1,9 +1,9 @@
 import os
-import subprocess
 import json
 import glob
-from typing import Tuple, Optional
+from typing import Dict, Tuple, Optional
 from aocd import get_data
+from aocd.models import Puzzle
 from datetime import datetime
 from dateutil.parser import parse
 from utils.environment import setup_environment
@@ -14,6 +14,9 @@ from aoc_elf import aocd_dir
 
 AOC_ROOT_DIR = get_aoc_root_dir()
 
+# Part A completion results keyed on post file path, stored with the file's mtime
+_PART_A_CACHE: Dict[str, Tuple[int, bool]] = {}
+
 
 def get_day_and_year() -> Tuple[int, int]:
     """
@@ -94,24 +97,70 @@ def get_puzzle_input(day: int, year: int, day_dir: str) -> bool:
     Returns:
         True if the data was successfully fetched and saved, False otherwise.
     """
-    input_file = os.path.join(day_dir, "input.txt")
+    input_file = f"{day_dir}{os.sep}input.txt"
 
-    if not os.path.exists(day_dir):
-        os.makedirs(day_dir, exist_ok=True)
+    os.makedirs(day_dir, exist_ok=True)
 
-    if not os.path.exists(input_file):
-        try:
+    try:
+        f = open(input_file, "x")
+    except FileExistsError:
+        return False
+
+    fetched = False
+    try:
+        with f:
             data = get_data(day=day, year=year)
-            with open(input_file, "w") as f:
-                f.write(data)
-                print(
-                    f"Fetched puzzle input for day '{day}' of year '{year}'! Located at {input_file}."
-                )
-            return True
-        except Exception as e:
-            print(f"Failed to fetch puzzle input for day '{day}' of year '{year}'!")
-            print(f"Error: {e}")
-            return False
+            f.write(data)
+        fetched = True
+        print(
+            f"Fetched puzzle input for day '{day}' of year '{year}'! Located at {input_file}."
+        )
+        return True
+    except Exception as e:
+        print(f"Failed to fetch puzzle input for day '{day}' of year '{year}'!")
+        print(f"Error: {e}")
+        return False
+    finally:
+        # Don't leave an empty input.txt behind (even on Ctrl-C) that would block the next fetch
+        if not fetched:
+            os.remove(input_file)
+
+
+def get_example_data(day: int, year: int) -> str:
+    """
+    Retrieves the example data for a given day and year using aocd's Python API,
+    formatted the same way as the output of 'aocd DAY YEAR --example'.
+
+    Args:
+        day: The day of the puzzle.
+        year: The year of the puzzle.
+
+    Returns:
+        The formatted example data as a string.
+    """
+    puzzle = Puzzle(year=year, day=day)
+    examples = puzzle.examples
+    if not examples:
+        return f"no examples available for {year}/{day:02d}\n"
+
+    width = 80
+    lines = [
+        f"--- Day {puzzle.day}: {puzzle.title} ---".center(width, " "),
+        puzzle.url.center(width, " "),
+    ]
+    for i, example in enumerate(examples, start=1):
+        lines.append(f" Example data {i}/{len(examples)} ".center(width, "-"))
+        lines.append(example.input_data)
+        lines.append("-" * width)
+        lines.append(f"answer_a: {example.answer_a or '-'}")
+        lines.append(f"answer_b: {example.answer_b or '-'}")
+        if example.extra:
+            lines.append(f"extra: {example.extra}")
+        lines.append("-" * width)
+        lines.append("")
+        lines.append("")
+
+    return "\n".join(lines) + "\n"
 
 
 def get_example_input(day: int, year: int, day_dir: str) -> bool:
@@ -132,31 +181,32 @@ def get_example_input(day: int, year: int, day_dir: str) -> bool:
             f"\nDirectory '{day_dir}' does not exist. Enter new directory to save new example.txt: \n"
         )
 
-    example_file = os.path.join(day_dir, "example.txt")
+    example_file = f"{day_dir}{os.sep}example.txt"
 
-    if not os.path.exists(day_dir):
-        os.makedirs(day_dir, exist_ok=True)
+    os.makedirs(day_dir, exist_ok=True)
 
-    if not os.path.exists(example_file):
-        try:
-            result = subprocess.run(
-                ["aocd", str(day), str(year), "--example"],
-                capture_output=True,
-                text=True,
-                check=True,
-            )
-            with open(example_file, "w") as f:
-                f.write(result.stdout)
-                print(
-                    f"Fetched example input for day '{day}' of year '{year}'! Located at {example_file}."
-                )
-            return True
-        except subprocess.CalledProcessError as e:
-            error_message = e.stderr.strip().split("\n")[-1]
-            print(f"Failed to fetch example input for day '{day}' of year '{year}'!")
-            # print(f"Error: {error_message}") #TODO: Make this cleaner? Seems redundant as the error message /should always match get_puzzle_input()
-            return False
-    return False
+    try:
+        f = open(example_file, "x")
+    except FileExistsError:
+        return False
+
+    fetched = False
+    try:
+        with f:
+            f.write(get_example_data(day, year))
+        fetched = True
+        print(
+            f"Fetched example input for day '{day}' of year '{year}'! Located at {example_file}."
+        )
+        return True
+    except Exception as e:
+        print(f"Failed to fetch example input for day '{day}' of year '{year}'!")
+        # print(f"Error: {e}") #TODO: Make this cleaner? Seems redundant as the error message /should always match get_puzzle_input()
+        return False
+    finally:
+        # Don't leave an empty example.txt behind (even on Ctrl-C) that would block the next fetch
+        if not fetched:
+            os.remove(example_file)
 
 
 def check_for_part_a_completion(day: int, year: int, aocd_dir: str) -> bool:
@@ -171,21 +221,28 @@ def check_for_part_a_completion(day: int, year: int, aocd_dir: str) -> bool:
     Returns:
         True if part A has been completed, False otherwise.
     """
-    post_file_path = os.path.join(aocd_dir, f"{year}/day_{day:02}_post.json")
+    post_file_path = f"{aocd_dir}{os.sep}{year}{os.sep}day_{day:02}_post.json"
 
-    if not os.path.exists(post_file_path):
+    try:
+        mtime = os.stat(post_file_path).st_mtime_ns
+    except FileNotFoundError:
         return False
 
+    cached = _PART_A_CACHE.get(post_file_path)
+    if cached and cached[0] == mtime:
+        return cached[1]
+
     with open(post_file_path, "r") as file:
         submissions = json.load(file)
 
-    for submission in submissions:
-        if submission.get(
-            "part"
-        ) == "a" and "That's the right answer" in submission.get("message", ""):
-            return True
+    completed = any(
+        submission.get("part") == "a"
+        and "That's the right answer" in submission.get("message", "")
+        for submission in submissions
+    )
 
-    return False
+    _PART_A_CACHE[post_file_path] = (mtime, completed)
+    return completed
 
 
 def check_and_update_example_input(day: int, year: int, day_dir: str) -> bool:
@@ -203,34 +260,25 @@ def check_and_update_example_input(day: int, year: int, day_dir: str) -> bool:
     example_file = os.path.join(day_dir, "example.txt")
 
     if os.path.exists(example_file):
-        with open(example_file, "r") as file:
+        with open(example_file, "rb") as file:
             example_input = file.read()
 
-        if "answer_b: -" in example_input:
+        if b"answer_b: -" in example_input:
             try:
-                result = subprocess.run(
-                    ["aocd", str(day), str(year), "--example"],
-                    capture_output=True,
-                    text=True,
-                    check=True,
-                )
+                updated_example_input = get_example_data(day, year)
                 with open(example_file, "w") as f:
-                    f.write(result.stdout)
-
-                with open(example_file, "r") as file:
-                    updated_example_input = file.read()
+                    f.write(updated_example_input)
 
                 if "answer_b: -" not in updated_example_input:
                     print(
                         f"Updated example input for Part B for day '{day}' of year '{year}' in {example_file}."
                     )
                 return True
-            except subprocess.CalledProcessError as e:
-                error_message = e.stderr.strip().split("\n")[-1]
+            except Exception as e:
                 print(
                     f"Failed to update example input for Part B for day '{day}' of year '{year}' in {example_file}."
                 )
-                # print(f"Error: {error_message}")
+                # print(f"Error: {e}")
                 return False
     else:
         return get_example_input(day, year)
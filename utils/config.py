@@ -4,6 +4,8 @@ from dotenv import load_dotenv
 
 ENV_FILE = ".env"
 
+_GITHUB_RE = re.compile(r"https://github\.com/[a-zA-Z0-9_-]+/[a-zA-Z0-9._-]+/?")
+
 
 def is_valid_github_repo(url: str) -> bool:
     """
@@ -15,8 +17,9 @@ def is_valid_github_repo(url: str) -> bool:
     Returns:
         bool: True if the URL is a valid GitHub repository URL, False otherwise.
     """
-    pattern = r"https://github\.com/[a-zA-Z0-9_-]+/[a-zA-Z0-9._-]+/?"
-    return re.match(pattern, url) is not None
+    if not (url.startswith("https://github.com/") and 20 < len(url) < 200):
+        return False
+    return _GITHUB_RE.match(url) is not None
 
 
 def is_valid_base_dir(base_dir: str, prompt: bool) -> bool:
@@ -67,7 +70,11 @@ def reload_env() -> None:
     """
     Reloads the environment variables from the .env file.
     """
+    # Imported here as utils.environment imports this module
+    from utils.environment import invalidate_environment_cache
+
     load_dotenv(override=True)
+    invalidate_environment_cache()
 
 
 def modify_config() -> None:
@@ -82,12 +89,12 @@ def modify_config() -> None:
 
     BASE_DIR = get_input(
         f"Current base directory is '{CURRENT_BASE_DIR}'. Enter new base directory (leave blank to keep current): ",
-        os.getenv("BASE_DIR"),
+        CURRENT_BASE_DIR,
         validator=(is_valid_base_dir),
     )
     GITHUB_REPO = get_input(
         f"\nCurrent GitHub repository url is '{CURRENT_GITHUB_REPO}'. Enter new url (leave blank to keep current): ",
-        os.getenv("GITHUB_REPO"),
+        CURRENT_GITHUB_REPO,
         is_valid_github_repo,
     )
 
@@ -100,14 +107,16 @@ def modify_config() -> None:
     print("5. Find the 'session' cookie and copy its value.\n")
     AOC_SESSION = get_input(
         "Enter your AOC_SESSION token (leave blank to keep current): ",
-        default=os.getenv("AOC_SESSION"),
+        default=CURRENT_AOC_SESSION,
     )
 
     with open(ENV_FILE, "w") as f:
-        f.write(f"BASE_DIR={BASE_DIR}\n")
-        f.write(f"GITHUB_REPO={GITHUB_REPO}\n")
-        f.write(f"AOC_SESSION={AOC_SESSION}\n")
-        f.write("SETUP_RAN=1\n")
+        f.write(
+            f"BASE_DIR={BASE_DIR}\n"
+            f"GITHUB_REPO={GITHUB_REPO}\n"
+            f"AOC_SESSION={AOC_SESSION}\n"
+            "SETUP_RAN=1\n"
+        )
 
     reload_env()
 
@@ -151,10 +160,12 @@ def setup_config() -> None:
     )
 
     with open(ENV_FILE, "w") as f:
-        f.write(f"BASE_DIR={BASE_DIR}\n")
-        f.write(f"GITHUB_REPO={GITHUB_REPO}\n")
-        f.write(f"AOC_SESSION={AOC_SESSION}\n")
-        f.write("SETUP_RAN=1\n")
+        f.write(
+            f"BASE_DIR={BASE_DIR}\n"
+            f"GITHUB_REPO={GITHUB_REPO}\n"
+            f"AOC_SESSION={AOC_SESSION}\n"
+            "SETUP_RAN=1\n"
+        )
 
     reload_env()
 
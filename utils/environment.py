@@ -1,7 +1,32 @@
 import os
+from typing import Optional
 from dotenv import load_dotenv
 from utils.config import setup_config, ENV_FILE
 
+# setup_environment() result, keyed on the .env file's (mtime, size) signature
+_ENV_CACHE = {}
+
+
+def _env_file_signature() -> Optional[tuple[int, int]]:
+    """
+    Builds a cheap signature of the .env file used to detect changes.
+
+    Returns:
+        A tuple of the file's modification time (ns) and size, or None if the file does not exist.
+    """
+    try:
+        stat = os.stat(ENV_FILE)
+    except FileNotFoundError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+def invalidate_environment_cache() -> None:
+    """
+    Forces the next setup_environment() call to reload the .env file.
+    """
+    _ENV_CACHE.clear()
+
 
 def check_env_exists() -> bool:
     """
@@ -37,6 +62,10 @@ def setup_environment() -> tuple[str, str, str, str]:
     Returns:
         A tuple containing the BASE_DIR, AOC_ROOT_DIR, GITHUB_REPO, and AOC_SESSION.
     """
+    signature = _env_file_signature()
+    if "environment" in _ENV_CACHE and _ENV_CACHE["signature"] == signature:
+        return _ENV_CACHE["environment"]
+
     load_dotenv()
 
     BASE_DIR = os.getenv("BASE_DIR", "")
@@ -44,10 +73,14 @@ def setup_environment() -> tuple[str, str, str, str]:
     GITHUB_REPO = os.getenv("GITHUB_REPO")
     AOC_SESSION = os.getenv("AOC_SESSION")
 
-    return BASE_DIR, AOC_ROOT_DIR, GITHUB_REPO, AOC_SESSION
+    environment = BASE_DIR, AOC_ROOT_DIR, GITHUB_REPO, AOC_SESSION
+    _ENV_CACHE.update(signature=signature, environment=environment)
+    return environment
 
 
-def unused_env_vars(BASE_DIR: str, GITHUB_REPO: str, AOC_SESSION: str) -> list[str]:
+def unused_env_vars(
+    BASE_DIR: str, GITHUB_REPO: str, AOC_SESSION: str
+) -> frozenset[str]:
     """
     Identifies any unused environment variables.
 
@@ -57,7 +90,7 @@ def unused_env_vars(BASE_DIR: str, GITHUB_REPO: str, AOC_SESSION: str) -> list[s
         AOC_SESSION: The AOC session token.
 
     Returns:
-        A list of strings representing the names of unused environment variables.
+        A frozenset of strings representing the names of unused environment variables.
     """
     unused_envs = []
 
@@ -68,7 +101,7 @@ def unused_env_vars(BASE_DIR: str, GITHUB_REPO: str, AOC_SESSION: str) -> list[s
     if not AOC_SESSION or AOC_SESSION.lower() == "none":
         unused_envs.append("AOC_SESSION")
 
-    return unused_envs
+    return frozenset(unused_envs)
 
 
 def initialize_environment() -> tuple[str, str, str, str]:
@@ -1,11 +1,22 @@
 import os
 import shutil
+import stat
+import sys
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Optional, Dict, List, Tuple
+from typing import Callable, Optional, Dict, List, Tuple
 from utils.environment import setup_environment
 
 AOC_DAYS = 25  # Advent of code has 25 challenges per year
 
+SOLUTION_TEMPLATE_PATH = os.path.join("utils", "templates", "solution.py")
+HELPER_TEMPLATE_PATH = os.path.join("utils", "templates", "helper.py")
+
+# Template contents keyed on path, read once and reused for every day directory
+_TEMPLATE_CACHE: Dict[str, bytes] = {}
+
 
 def get_aoc_root_dir() -> str:
     """
@@ -41,16 +52,17 @@ def get_input() -> int:
         The entered year or the current year if no input is provided.
     """
     current_year = datetime.now().year
-    year = input(f"Enter the AOC year (default: {current_year}): ").strip()
 
-    if not year:
-        return current_year
+    while True:
+        year = input(f"Enter the AOC year (default: {current_year}): ").strip()
 
-    try:
-        return int(year)
-    except ValueError:
-        print(f"Invalid year: {year}")
-        return get_input()
+        if not year:
+            return current_year
+
+        try:
+            return int(year)
+        except ValueError:
+            print(f"Invalid year: {year}")
 
 
 def confirm_overwrite(path: str) -> bool:
@@ -106,6 +118,104 @@ def create_year_dir(year: int, AOC_ROOT_DIR: str) -> Optional[str]:
     return year_dir
 
 
+def is_empty_dir(path: str) -> bool:
+    """
+    Checks if a directory has no entries, reading at most one entry.
+
+    Args:
+        path: The path of the directory to check.
+
+    Returns:
+        True if the directory is empty, False otherwise.
+    """
+    with os.scandir(path) as entries:
+        return next(entries, None) is None
+
+
+def remove_dir(path: str) -> None:
+    """
+    Removes a directory tree, clearing read-only flags (e.g. git objects on Windows)
+    and warning with the leftover path if anything could not be removed.
+
+    Args:
+        path: The path of the directory to remove.
+    """
+    errors = []
+
+    def on_error(func: Callable, failed_path: str, _) -> None:
+        try:
+            os.chmod(failed_path, stat.S_IWRITE)
+            func(failed_path)
+        except OSError as e:
+            errors.append((failed_path, e))
+
+    # onerror is deprecated from Python 3.12 in favour of onexc
+    if sys.version_info >= (3, 12):
+        shutil.rmtree(path, onexc=on_error)
+    else:
+        shutil.rmtree(path, onerror=on_error)
+
+    if errors:
+        print(f"\nWarning: failed to remove {path}. Please delete it manually:")
+        for failed_path, e in errors:
+            print(f"  - {failed_path}: {e}")
+
+
+def discard_dir(path: str) -> threading.Thread:
+    """
+    Moves a directory out of the way and deletes it on a background thread.
+
+    Args:
+        path: The path of the directory to discard.
+
+    Returns:
+        The thread removing the directory, which the caller should join.
+    """
+    trash_dir = tempfile.mkdtemp(prefix=".discard_", dir=os.path.dirname(path))
+    os.rename(path, os.path.join(trash_dir, os.path.basename(path)))
+
+    thread = threading.Thread(target=remove_dir, args=(trash_dir,))
+    thread.start()
+    return thread
+
+
+def setup_day_dir(
+    year_dir: str, day_name: str, day_exists: bool, year_fd: Optional[int] = None
+) -> Tuple[bool, Optional[threading.Thread]]:
+    """
+    Creates a single day directory and copies the solution templates into it.
+
+    Args:
+        year_dir: The path to the year directory.
+        day_name: The name of the day directory, e.g. 'day_01'.
+        day_exists: Whether the directory already exists and should be overwritten.
+        year_fd: An open file descriptor for year_dir used to mkdir relative to it.
+
+    Returns:
+        A tuple of whether the directory was set up, and the thread removing the
+        overwritten directory (if any), which the caller should join.
+    """
+    day_dir = os.path.join(year_dir, day_name)
+    cleanup_thread = None
+
+    try:
+        # An existing empty directory is reused, otherwise it is moved aside
+        # and removed in the background if the user chose to overwrite
+        if day_exists and not is_empty_dir(day_dir):
+            cleanup_thread = discard_dir(day_dir)
+            day_exists = False
+        if not day_exists:
+            # The year directory exists, so a plain mkdir is enough
+            if year_fd is not None:
+                os.mkdir(day_name, dir_fd=year_fd)
+            else:
+                os.mkdir(day_dir)
+        return copy_solution_template(day_dir), cleanup_thread
+    except Exception as e:
+        print(f"Failed to create directory {day_dir}: {e}")
+        return False, cleanup_thread
+
+
 def create_day_dir(year_dir: str) -> Dict[str, List[str]]:
     """
     Creates directories for each day of Advent of Code within the specified year directory.
@@ -118,29 +228,85 @@ def create_day_dir(year_dir: str) -> Dict[str, List[str]]:
     """
     results = {"created": [], "skipped": []}
 
-    for day in range(1, AOC_DAYS + 1):
-        day_dir = os.path.join(year_dir, f"day_{day:02}")
-        if os.path.exists(day_dir) and not confirm_overwrite(day_dir):
-            results["skipped"].append(day_dir)
+    # One directory read instead of an exists() stat per day
+    with os.scandir(year_dir) as entries:
+        existing = {entry.name for entry in entries}
+
+    # Ask about overwrites up front, stdin can't be shared by the worker threads
+    day_names = [f"day_{day:02}" for day in range(1, AOC_DAYS + 1)]
+    to_setup = {}
+    for day_name in day_names:
+        day_exists = day_name in existing
+        if day_exists and not confirm_overwrite(os.path.join(year_dir, day_name)):
             continue
+        to_setup[day_name] = day_exists
 
-        try:
-            if os.path.exists(day_dir):
-                shutil.rmtree(
-                    day_dir
-                )  # Remove the existing directory if the user chose to overwrite
-            os.makedirs(day_dir, exist_ok=True)  # Create the directory
-            if copy_solution_template(day_dir):
-                results["created"].append(day_dir)
-            else:
-                results["skipped"].append(day_dir)
-        except Exception as e:
-            print(f"Failed to create directory {day_dir}: {e}")
-            results["skipped"].append(day_dir)
+    # Create day directories relative to an open year directory fd (mkdirat) so the
+    # kernel doesn't re-resolve the full year_dir path for every day
+    year_fd = None
+    if os.mkdir in os.supports_dir_fd:
+        year_fd = os.open(year_dir, os.O_RDONLY)
+
+    created = {}
+    cleanup_threads = []
+    try:
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            futures = {
+                day_name: executor.submit(
+                    setup_day_dir, year_dir, day_name, day_exists, year_fd
+                )
+                for day_name, day_exists in to_setup.items()
+            }
+            for day_name, future in futures.items():
+                created[day_name], cleanup_thread = future.result()
+                if cleanup_thread:
+                    cleanup_threads.append(cleanup_thread)
+    finally:
+        if year_fd is not None:
+            os.close(year_fd)
+        for thread in cleanup_threads:
+            thread.join()
+
+    for day_name in day_names:
+        key = "created" if created.get(day_name) else "skipped"
+        results[key].append(os.path.join(year_dir, day_name))
 
     return results
 
 
+def read_template(path: str) -> bytes:
+    """
+    Reads a template file, caching its contents so it is only read from disk once.
+
+    Args:
+        path: The path of the template file.
+
+    Returns:
+        The contents of the template as bytes.
+    """
+    if path not in _TEMPLATE_CACHE:
+        with open(path, "rb") as file:
+            _TEMPLATE_CACHE[path] = file.read()
+    return _TEMPLATE_CACHE[path]
+
+
+def write_file(path: str, data: bytes) -> None:
+    """
+    Writes bytes to a new or truncated file with a single open/write/close.
+
+    Args:
+        path: The path of the file to write.
+        data: The contents to write.
+    """
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view) :]
+    finally:
+        os.close(fd)
+
+
 def copy_solution_template(day_dir: str) -> bool:
     """
     Copies the solution and helper templates to the specified day's directory.
@@ -151,15 +317,12 @@ def copy_solution_template(day_dir: str) -> bool:
     Returns:
         True if successful, False otherwise.
     """
-    solution_template_path = os.path.join("utils", "templates", "solution.py")
-    helper_template_path = os.path.join("utils", "templates", "helper.py")
-
     solution_dest_path = os.path.join(day_dir, "solution.py")
     helper_dest_path = os.path.join(day_dir, "helper.py")
 
     try:
-        shutil.copy(solution_template_path, solution_dest_path)
-        shutil.copy(helper_template_path, helper_dest_path)
+        write_file(solution_dest_path, read_template(SOLUTION_TEMPLATE_PATH))
+        write_file(helper_dest_path, read_template(HELPER_TEMPLATE_PATH))
         return True
     except Exception as e:
         print(f"Failed to copy templates to {day_dir}: {e}")
@@ -1,10 +1,11 @@
+import shutil
 import subprocess
 import platform
-from typing import Optional
+from typing import List, Optional
 from utils.aoc_data import get_day_and_year
-from utils.environment import setup_environment
+from utils.file_operations import get_aoc_root_dir
 
-_, AOC_ROOT_DIR, _, _ = setup_environment()
+_OS_NAME = platform.system().lower()
 
 
 def is_git_installed() -> bool:
@@ -13,30 +14,20 @@ def is_git_installed() -> bool:
     Returns:
         bool: True if Git is installed, False otherwise.
     """
-    try:
-        subprocess.run(
-            ["git", "--version"],
-            check=True,
-            stdout=subprocess.DEVNULL,
-            stderr=subprocess.DEVNULL,
-        )
-        return True
-    except (subprocess.CalledProcessError, FileNotFoundError):
-        return False
+    return shutil.which("git") is not None
 
 
 def git_install_instructions() -> None:
     """Print instructions for installing Git on the system."""
-    os_name = platform.system().lower()
-    if "windows" in os_name:
+    if "windows" in _OS_NAME:
         print(
             "Git is not installed. Please download and install it from https://git-scm.com/download/win."
         )
-    elif "linux" in os_name:
+    elif "linux" in _OS_NAME:
         print(
             "Git is not installed. You can typically install it using your package manager. e.g., 'sudo apt install git'."
         )
-    elif "darwin" in os_name:
+    elif "darwin" in _OS_NAME:
         print(
             "Git is not installed. You can install it using Homebrew with the command 'brew install git'."
         )
@@ -44,34 +35,22 @@ def git_install_instructions() -> None:
         print("Unsupported operating system. Please install Git manually.")
 
 
-def run_git_command(command: str) -> None:
-    """Run a git command and print its output.
+def run_git_command(command: List[str]) -> None:
+    """Run a git command, letting it write its output straight to the terminal.
 
     Args:
-        command (str): The Git command to run.
+        command (List[str]): The Git command to run as an argument list, e.g. ["git", "init"].
     """
     try:
-        result = subprocess.run(
-            command,
-            check=True,
-            shell=True,
-            cwd=AOC_ROOT_DIR,
-            text=True,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-        )
-        print(result.stdout)
-        print(result.stderr)
+        subprocess.run(command, check=True, cwd=get_aoc_root_dir())
         print("Git command completed successfully.")
-    except subprocess.CalledProcessError as e:
+    except subprocess.CalledProcessError:
         print("Error: Git command failed.")
-        print(e.stdout)
-        print(e.stderr)
 
 
 def git_init() -> None:
     """Initialize Git"""
-    run_git_command("git init")
+    run_git_command(["git", "init"])
 
 
 def git_add_commit(day: Optional[int] = None, year: Optional[int] = None) -> None:
@@ -91,13 +70,13 @@ def git_add_commit(day: Optional[int] = None, year: Optional[int] = None) -> Non
     if not commit_message:
         commit_message = default_commit_message
 
-    run_git_command(f"git add {year}/day_{day:02}")
-    run_git_command(f"git commit -m '{commit_message}'")
+    run_git_command(["git", "add", f"{year}/day_{day:02}"])
+    run_git_command(["git", "commit", "-m", commit_message])
 
 
 def git_push() -> None:
     """Push to GitHub"""
-    run_git_command("git push origin main")
+    run_git_command(["git", "push", "origin", "main"])
 
 
 def perform_git_operations() -> None:
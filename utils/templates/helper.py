@@ -1,4 +1,5 @@
 import os
+import re
 import time
 import argparse
 import colorama
@@ -13,6 +14,13 @@ debug_mode = False
 debug_helper_mode = False
 debug_solution_mode = False
 
+# Matches one 'aocd --example' section: the data after the "Example data" header,
+# followed by a separator line and the answer_a/answer_b lines
+EXAMPLE_SECTION_RE = re.compile(
+    r"^-*\s*Example data[^\n]*\n(.*?)\n-{80}\nanswer_a: ([^\n]*)\nanswer_b: ([^\n]*)",
+    re.DOTALL | re.MULTILINE,
+)
+
 
 # Common functions
 def verify_input_file(is_example: bool) -> None:
@@ -73,10 +81,10 @@ def profile(func: Callable) -> Callable:
 
     @wraps(func)
     def wrapper(*args, **kwargs):
-        start_time = time.time()
+        start_time = time.perf_counter_ns()
         result = func(*args, **kwargs)
-        end_time = time.time()
-        exec_time = end_time - start_time
+        end_time = time.perf_counter_ns()
+        exec_time = (end_time - start_time) / 1e9
         return result, exec_time
 
     return wrapper
@@ -314,58 +322,22 @@ def parse_example_data(
     Returns:
     List[Tuple[str, Optional[str], Optional[str]]]: A list containing tuples of example data and expected answers for part 1 and 2.
     """
-    examples = []
     with open(file_path, "r") as file:
         content = file.read()
 
-    example_sections = content.split(
-        "--------------------------------------------------------------------------------"
-    )
-
-    extended_sections = []
-    for i in range(0, len(example_sections) - 1, 2):
-        extended_section = example_sections[i] + example_sections[i + 1]
-        extended_sections.append(extended_section)
-
-    for section in extended_sections:
-        if "Example data" in section:
-            lines = section.splitlines()
-
-            if debug_helper_mode:
-                print(f"{green_text('Section:')} \n{section}")
-
-            try:
-                start_idx = (
-                    next(i for i, line in enumerate(lines) if "Example data" in line)
-                    + 1
-                )
-
-                end_idx = next(
-                    (i for i, line in enumerate(lines) if line.startswith("answer_a:")),
-                    len(lines),
-                )
+    examples = []
+    for section in EXAMPLE_SECTION_RE.finditer(content):
+        example_data, answer_a, answer_b = section.groups()
+        example_data = example_data.strip()
 
-                example_data = "\n".join(lines[start_idx:end_idx]).strip()
-                answer_a = (
-                    lines[end_idx].split(": ")[1] if end_idx < len(lines) else None
-                )
-                answer_b = (
-                    lines[end_idx + 1].split(": ")[1]
-                    if end_idx + 1 < len(lines)
-                    else None
-                )
+        if debug_helper_mode:
+            print(f"{green_text('Section:')} \n{section.group(0)}")
+            print(f"{green_text('Example data:')} \n{example_data}")
+            print(
+                f"\n{green_text('Extracted answers:')} \np1: {answer_a}, p2: {answer_b}\n"
+            )
 
-                if debug_helper_mode:
-                    print(f"{green_text('Example data:')} \n{example_data}")
-                    print(
-                        f"\n{green_text('Extracted answers:')} \np1: {answer_a}, p2: {answer_b}\n"
-                    )
-
-                examples.append((example_data, answer_a, answer_b))
-            except (IndexError, ValueError) as e:
-                if debug_helper_mode:
-                    print(f"{red_text('Error parsing section:')} {str(e)}")
-                    print(f"{red_text('Lines in section:')} {str(lines)}")
+        examples.append((example_data, answer_a, answer_b))
 
     return examples
 